@@ -1,9 +1,11 @@
 import logging
 import logging.config
+from typing import TYPE_CHECKING
 
 from colorama import init  # type: ignore
 
-from commitizen.cz.base import BaseCommitizen
+if TYPE_CHECKING:
+    from commitizen.cz.base import BaseCommitizen
 
 init()
 
@@ -27,3 +29,14 @@ LOGGING = {
 logging.config.dictConfig(LOGGING)
 
 __all__ = ["BaseCommitizen"]
+
+
+def __getattr__(name: str):
+    # The BaseCommitizen re-export drags in the whole prompt and plugin
+    # stack; resolve it lazily so `import commitizen` stays cheap.
+    if name == "BaseCommitizen":
+        from commitizen.cz.base import BaseCommitizen
+
+        globals()[name] = BaseCommitizen
+        return BaseCommitizen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,17 +2,15 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from copy import deepcopy
 from functools import partial
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Sequence
+from typing import Any, Sequence, cast
 
-import argcomplete
-from decli import cli
-
-from commitizen import commands, config, out, version_schemes
+from commitizen import out
 from commitizen.exceptions import (
     CommitizenException,
     ExitCode,
@@ -66,6 +64,13 @@ class ParseKwargs(argparse.Action):
         setattr(namespace, self.dest, kwargs)
 
 
+# Arguments shared verbatim between the `bump` and `changelog` commands,
+# declared once so the two definitions cannot drift apart.
+file_name_argument = {
+    "name": "--file-name",
+    "help": "file name of changelog (default: 'CHANGELOG.md')",
+}
+
 tpl_arguments = (
     {
         "name": ["--template", "-t"],
@@ -83,379 +88,520 @@ tpl_arguments = (
     },
 )
 
-data = {
-    "prog": "cz",
-    "description": (
-        "Commitizen is a cli tool to generate conventional commits.\n"
-        "For more information about the topic go to "
-        "https://conventionalcommits.org/"
-    ),
-    "formatter_class": argparse.RawDescriptionHelpFormatter,
-    "arguments": [
-        {"name": "--debug", "action": "store_true", "help": "use debug mode"},
-        {
-            "name": ["-n", "--name"],
-            "help": "use the given commitizen (default: cz_conventional_commits)",
-        },
-        {
-            "name": ["-nr", "--no-raise"],
-            "type": str,
-            "required": False,
-            "help": "comma separated error codes that won't rise error, e.g: cz -nr 1,2,3 bump. See codes at https://commitizen-tools.github.io/commitizen/exit_codes/",
-        },
-    ],
-    "subcommands": {
-        "title": "commands",
-        "required": True,
-        "commands": [
-            {
-                "name": ["init"],
-                "help": "init commitizen configuration",
-                "func": commands.Init,
-            },
-            {
-                "name": ["commit", "c"],
-                "help": "create new commit",
-                "func": commands.Commit,
-                "arguments": [
-                    {
-                        "name": ["--retry"],
-                        "action": "store_true",
-                        "help": "retry last commit",
-                    },
-                    {
-                        "name": "--dry-run",
-                        "action": "store_true",
-                        "help": "show output to stdout, no commit, no modified files",
-                    },
-                    {
-                        "name": "--write-message-to-file",
-                        "type": Path,
-                        "metavar": "FILE_PATH",
-                        "help": "write message to file before committing (can be combined with --dry-run)",
-                    },
-                    {
-                        "name": ["-s", "--signoff"],
-                        "action": "store_true",
-                        "help": "sign off the commit",
-                    },
-                    {
-                        "name": ["-a", "--all"],
-                        "action": "store_true",
-                        "help": "Tell the command to automatically stage files that have been modified and deleted, but new files you have not told Git about are not affected.",
-                    },
-                ],
-            },
-            {
-                "name": "ls",
-                "help": "show available commitizens",
-                "func": commands.ListCz,
-            },
-            {
-                "name": "example",
-                "help": "show commit example",
-                "func": commands.Example,
-            },
-            {
-                "name": "info",
-                "help": "show information about the cz",
-                "func": commands.Info,
-            },
-            {"name": "schema", "help": "show commit schema", "func": commands.Schema},
-            {
-                "name": "bump",
-                "help": "bump semantic version based on the git log",
-                "func": commands.Bump,
-                "arguments": [
-                    {
-                        "name": "--dry-run",
-                        "action": "store_true",
-                        "help": "show output to stdout, no commit, no modified files",
-                    },
-                    {
-                        "name": "--files-only",
-                        "action": "store_true",
-                        "help": "bump version in the files from the config",
-                    },
-                    {
-                        "name": "--local-version",
-                        "action": "store_true",
-                        "help": "bump only the local version portion",
-                    },
-                    {
-                        "name": ["--changelog", "-ch"],
-                        "action": "store_true",
-                        "default": False,
-                        "help": "generate the changelog for the newest version",
-                    },
-                    {
-                        "name": ["--no-verify"],
-                        "action": "store_true",
-                        "default": False,
-                        "help": "this option bypasses the pre-commit and commit-msg hooks",
-                    },
-                    {
-                        "name": "--yes",
-                        "action": "store_true",
-                        "help": "accept automatically questions done",
-                    },
-                    {
-                        "name": "--tag-format",
-                        "help": (
-                            "the format used to tag the commit and read it, "
-                            "use it in existing projects, "
-                            "wrap around simple quotes"
-                        ),
-                    },
-                    {
-                        "name": "--bump-message",
-                        "help": (
-                            "template used to create the release commit, "
-                            "useful when working with CI"
-                        ),
-                    },
-                    {
-                        "name": ["--prerelease", "-pr"],
-                        "help": "choose type of prerelease",
-                        "choices": ["alpha", "beta", "rc"],
-                    },
-                    {
-                        "name": ["--devrelease", "-d"],
-                        "help": "specify non-negative integer for dev. release",
-                        "type": int,
-                    },
-                    {
-                        "name": ["--increment"],
-                        "help": "manually specify the desired increment",
-                        "choices": ["MAJOR", "MINOR", "PATCH"],
-                        "type": str.upper,
-                    },
-                    {
-                        "name": ["--check-consistency", "-cc"],
-                        "help": (
-                            "check consistency among versions defined in "
-                            "commitizen configuration and version_files"
-                        ),
-                        "action": "store_true",
-                    },
-                    {
-                        "name": ["--annotated-tag", "-at"],
-                        "help": "create annotated tag instead of lightweight one",
-                        "action": "store_true",
-                    },
-                    {
-                        "name": ["--gpg-sign", "-s"],
-                        "help": "sign tag instead of lightweight one",
-                        "default": False,
-                        "action": "store_true",
-                    },
-                    {
-                        "name": ["--changelog-to-stdout"],
-                        "action": "store_true",
-                        "default": False,
-                        "help": "Output changelog to the stdout",
-                    },
-                    {
-                        "name": ["--git-output-to-stderr"],
-                        "action": "store_true",
-                        "default": False,
-                        "help": "Redirect git output to stderr",
-                    },
-                    {
-                        "name": ["--retry"],
-                        "action": "store_true",
-                        "default": False,
-                        "help": "retry commit if it fails the 1st time",
-                    },
-                    {
-                        "name": ["--major-version-zero"],
-                        "action": "store_true",
-                        "default": None,
-                        "help": "keep major version at zero, even for breaking changes",
-                    },
-                    *deepcopy(tpl_arguments),
-                    {
-                        "name": "--file-name",
-                        "help": "file name of changelog (default: 'CHANGELOG.md')",
-                    },
-                    {
-                        "name": ["--prerelease-offset"],
-                        "type": int,
-                        "default": None,
-                        "help": "start pre-releases with this offset",
-                    },
-                    {
-                        "name": ["--version-scheme"],
-                        "help": "choose version scheme",
-                        "default": None,
-                        "choices": version_schemes.KNOWN_SCHEMES,
-                    },
-                    {
-                        "name": ["--version-type"],
-                        "help": "Deprecated, use --version-scheme",
-                        "default": None,
-                        "choices": version_schemes.KNOWN_SCHEMES,
-                    },
-                    {
-                        "name": "manual_version",
-                        "type": str,
-                        "nargs": "?",
-                        "help": "bump to the given version (e.g: 1.5.3)",
-                        "metavar": "MANUAL_VERSION",
-                    },
-                ],
-            },
+
+def _build_data() -> dict:
+    # version_schemes resolves its known schemes from entry points and
+    # pulls in packaging; only the parser spec needs it.
+    from commitizen import version_schemes
+
+    # KNOWN_SCHEMES is a set; sort it so the spec (and the cache digest
+    # derived from its repr) is identical from process to process.
+    known_schemes = sorted(version_schemes.KNOWN_SCHEMES)
+
+    version_scheme_argument = {
+        "name": ["--version-scheme"],
+        "help": "choose version scheme",
+        "default": None,
+        "choices": known_schemes,
+    }
+
+    return {
+        "prog": "cz",
+        "description": (
+            "Commitizen is a cli tool to generate conventional commits.\n"
+            "For more information about the topic go to "
+            "https://conventionalcommits.org/"
+        ),
+        "formatter_class": argparse.RawDescriptionHelpFormatter,
+        "arguments": [
+            {"name": "--debug", "action": "store_true", "help": "use debug mode"},
             {
-                "name": ["changelog", "ch"],
-                "help": (
-                    "generate changelog (note that it will overwrite existing file)"
-                ),
-                "func": commands.Changelog,
-                "arguments": [
-                    {
-                        "name": "--dry-run",
-                        "action": "store_true",
-                        "default": False,
-                        "help": "show changelog to stdout",
-                    },
-                    {
-                        "name": "--file-name",
-                        "help": "file name of changelog (default: 'CHANGELOG.md')",
-                    },
-                    {
-                        "name": "--unreleased-version",
-                        "help": (
-                            "set the value for the new version (use the tag value), "
-                            "instead of using unreleased"
-                        ),
-                    },
-                    {
-                        "name": "--incremental",
-                        "action": "store_true",
-                        "default": False,
-                        "help": (
-                            "generates changelog from last created version, "
-                            "useful if the changelog has been manually modified"
-                        ),
-                    },
-                    {
-                        "name": "rev_range",
-                        "type": str,
-                        "nargs": "?",
-                        "help": "generates changelog for the given version (e.g: 1.5.3) or version range (e.g: 1.5.3..1.7.9)",
-                    },
-                    {
-                        "name": "--start-rev",
-                        "default": None,
-                        "help": (
-                            "start rev of the changelog. "
-                            "If not set, it will generate changelog from the start"
-                        ),
-                    },
-                    {
-                        "name": "--merge-prerelease",
-                        "action": "store_true",
-                        "default": False,
-                        "help": (
-                            "collect all changes from prereleases into next non-prerelease. "
-                            "If not set, it will include prereleases in the changelog"
-                        ),
-                    },
-                    {
-                        "name": ["--version-scheme"],
-                        "help": "choose version scheme",
-                        "default": None,
-                        "choices": version_schemes.KNOWN_SCHEMES,
-                    },
-                    {
-                        "name": "--export-template",
-                        "default": None,
-                        "help": "Export the changelog template into this file instead of rendering it",
-                    },
-                    *deepcopy(tpl_arguments),
-                ],
+                "name": ["-n", "--name"],
+                "help": "use the given commitizen (default: cz_conventional_commits)",
             },
             {
-                "name": ["check"],
-                "help": "validates that a commit message matches the commitizen schema",
-                "func": commands.Check,
-                "arguments": [
-                    {
-                        "name": "--commit-msg-file",
-                        "help": (
-                            "ask for the name of the temporal file that contains "
-                            "the commit message. "
-                            "Using it in a git hook script: MSG_FILE=$1"
-                        ),
-                        "exclusive_group": "group1",
-                    },
-                    {
-                        "name": "--rev-range",
-                        "help": "a range of git rev to check. e.g, master..HEAD",
-                        "exclusive_group": "group1",
-                    },
-                    {
-                        "name": ["-m", "--message"],
-                        "help": "commit message that needs to be checked",
-                        "exclusive_group": "group1",
-                    },
-                    {
-                        "name": ["--allow-abort"],
-                        "action": "store_true",
-                        "default": False,
-                        "help": "allow empty commit messages, which typically abort a commit",
-                    },
-                    {
-                        "name": ["--allowed-prefixes"],
-                        "nargs": "*",
-                        "help": "allowed commit message prefixes. "
-                        "If the message starts by one of these prefixes, "
-                        "the message won't be checked against the regex",
-                    },
-                ],
+                "name": ["-nr", "--no-raise"],
+                "type": str,
+                "required": False,
+                "help": "comma separated error codes that won't rise error, e.g: cz -nr 1,2,3 bump. See codes at https://commitizen-tools.github.io/commitizen/exit_codes/",
             },
             {
-                "name": ["version"],
-                "help": (
-                    "get the version of the installed commitizen or the current project"
-                    " (default: installed commitizen)"
-                ),
-                "func": commands.Version,
-                "arguments": [
-                    {
-                        "name": ["-r", "--report"],
-                        "help": "get system information for reporting bugs",
-                        "action": "store_true",
-                        "exclusive_group": "group1",
-                    },
-                    {
-                        "name": ["-p", "--project"],
-                        "help": "get the version of the current project",
-                        "action": "store_true",
-                        "exclusive_group": "group1",
-                    },
-                    {
-                        "name": ["-c", "--commitizen"],
-                        "help": "get the version of the installed commitizen",
-                        "action": "store_true",
-                        "exclusive_group": "group1",
-                    },
-                    {
-                        "name": ["-v", "--verbose"],
-                        "help": (
-                            "get the version of both the installed commitizen "
-                            "and the current project"
-                        ),
-                        "action": "store_true",
-                        "exclusive_group": "group1",
-                    },
-                ],
+                "name": "--no-config",
+                "action": "store_true",
+                "default": False,
+                "help": "skip reading any config file, useful when every setting is given through flags (e.g: cz --no-config -n cz_jira check)",
             },
         ],
-    },
-}
+        "subcommands": {
+            "title": "commands",
+            "required": True,
+            "commands": [
+                {
+                    "name": ["init"],
+                    "help": "init commitizen configuration",
+                    "func": "Init",
+                },
+                {
+                    "name": ["commit", "c"],
+                    "help": "create new commit",
+                    "func": "Commit",
+                    "arguments": [
+                        {
+                            "name": ["--retry"],
+                            "action": "store_true",
+                            "help": "retry last commit",
+                        },
+                        {
+                            "name": "--dry-run",
+                            "action": "store_true",
+                            "help": "show output to stdout, no commit, no modified files",
+                        },
+                        {
+                            "name": "--write-message-to-file",
+                            "type": Path,
+                            "metavar": "FILE_PATH",
+                            "help": "write message to file before committing (can be combined with --dry-run)",
+                        },
+                        {
+                            "name": ["-s", "--signoff"],
+                            "action": "store_true",
+                            "help": "sign off the commit",
+                        },
+                        {
+                            "name": ["-a", "--all"],
+                            "action": "store_true",
+                            "help": "Tell the command to automatically stage files that have been modified and deleted, but new files you have not told Git about are not affected.",
+                        },
+                    ],
+                },
+                {
+                    "name": "ls",
+                    "help": "show available commitizens",
+                    "func": "ListCz",
+                },
+                {
+                    "name": "example",
+                    "help": "show commit example",
+                    "func": "Example",
+                },
+                {
+                    "name": "info",
+                    "help": "show information about the cz",
+                    "func": "Info",
+                },
+                {"name": "schema", "help": "show commit schema", "func": "Schema"},
+                {
+                    "name": "bump",
+                    "help": "bump semantic version based on the git log",
+                    "func": "Bump",
+                    "arguments": [
+                        {
+                            "name": "--dry-run",
+                            "action": "store_true",
+                            "help": "show output to stdout, no commit, no modified files",
+                        },
+                        {
+                            "name": "--files-only",
+                            "action": "store_true",
+                            "help": "bump version in the files from the config",
+                        },
+                        {
+                            "name": "--local-version",
+                            "action": "store_true",
+                            "help": "bump only the local version portion",
+                        },
+                        {
+                            "name": ["--changelog", "-ch"],
+                            "action": "store_true",
+                            "default": False,
+                            "help": "generate the changelog for the newest version",
+                        },
+                        {
+                            "name": ["--no-verify"],
+                            "action": "store_true",
+                            "default": False,
+                            "help": "this option bypasses the pre-commit and commit-msg hooks",
+                        },
+                        {
+                            "name": "--yes",
+                            "action": "store_true",
+                            "help": "accept automatically questions done",
+                        },
+                        {
+                            "name": "--tag-format",
+                            "help": (
+                                "the format used to tag the commit and read it, "
+                                "use it in existing projects, "
+                                "wrap around simple quotes"
+                            ),
+                        },
+                        {
+                            "name": "--bump-message",
+                            "help": (
+                                "template used to create the release commit, "
+                                "useful when working with CI"
+                            ),
+                        },
+                        {
+                            "name": ["--prerelease", "-pr"],
+                            "help": "choose type of prerelease",
+                            "choices": ["alpha", "beta", "rc"],
+                        },
+                        {
+                            "name": ["--devrelease", "-d"],
+                            "help": "specify non-negative integer for dev. release",
+                            "type": int,
+                        },
+                        {
+                            "name": ["--increment"],
+                            "help": "manually specify the desired increment",
+                            "choices": ["MAJOR", "MINOR", "PATCH"],
+                            "type": str.upper,
+                        },
+                        {
+                            "name": ["--check-consistency", "-cc"],
+                            "help": (
+                                "check consistency among versions defined in "
+                                "commitizen configuration and version_files"
+                            ),
+                            "action": "store_true",
+                        },
+                        {
+                            "name": ["--annotated-tag", "-at"],
+                            "help": "create annotated tag instead of lightweight one",
+                            "action": "store_true",
+                        },
+                        {
+                            "name": ["--gpg-sign", "-s"],
+                            "help": "sign tag instead of lightweight one",
+                            "default": False,
+                            "action": "store_true",
+                        },
+                        {
+                            "name": ["--changelog-to-stdout"],
+                            "action": "store_true",
+                            "default": False,
+                            "help": "Output changelog to the stdout",
+                        },
+                        {
+                            "name": ["--git-output-to-stderr"],
+                            "action": "store_true",
+                            "default": False,
+                            "help": "Redirect git output to stderr",
+                        },
+                        {
+                            "name": ["--retry"],
+                            "action": "store_true",
+                            "default": False,
+                            "help": "retry commit if it fails the 1st time",
+                        },
+                        {
+                            "name": ["--major-version-zero"],
+                            "action": "store_true",
+                            "default": None,
+                            "help": "keep major version at zero, even for breaking changes",
+                        },
+                        *deepcopy(tpl_arguments),
+                        deepcopy(file_name_argument),
+                        {
+                            "name": ["--prerelease-offset"],
+                            "type": int,
+                            "default": None,
+                            "help": "start pre-releases with this offset",
+                        },
+                        deepcopy(version_scheme_argument),
+                        {
+                            "name": ["--version-type"],
+                            "help": "Deprecated, use --version-scheme",
+                            "default": None,
+                            "choices": known_schemes,
+                        },
+                        {
+                            "name": "manual_version",
+                            "type": str,
+                            "nargs": "?",
+                            "help": "bump to the given version (e.g: 1.5.3)",
+                            "metavar": "MANUAL_VERSION",
+                        },
+                    ],
+                },
+                {
+                    "name": ["changelog", "ch"],
+                    "help": (
+                        "generate changelog (note that it will overwrite existing file)"
+                    ),
+                    "func": "Changelog",
+                    "arguments": [
+                        {
+                            "name": "--dry-run",
+                            "action": "store_true",
+                            "default": False,
+                            "help": "show changelog to stdout",
+                        },
+                        deepcopy(file_name_argument),
+                        {
+                            "name": "--unreleased-version",
+                            "help": (
+                                "set the value for the new version (use the tag value), "
+                                "instead of using unreleased"
+                            ),
+                        },
+                        {
+                            "name": "--incremental",
+                            "action": "store_true",
+                            "default": False,
+                            "help": (
+                                "generates changelog from last created version, "
+                                "useful if the changelog has been manually modified"
+                            ),
+                        },
+                        {
+                            "name": "rev_range",
+                            "type": str,
+                            "nargs": "?",
+                            "help": "generates changelog for the given version (e.g: 1.5.3) or version range (e.g: 1.5.3..1.7.9)",
+                        },
+                        {
+                            "name": "--start-rev",
+                            "default": None,
+                            "help": (
+                                "start rev of the changelog. "
+                                "If not set, it will generate changelog from the start"
+                            ),
+                        },
+                        {
+                            "name": "--merge-prerelease",
+                            "action": "store_true",
+                            "default": False,
+                            "help": (
+                                "collect all changes from prereleases into next non-prerelease. "
+                                "If not set, it will include prereleases in the changelog"
+                            ),
+                        },
+                        deepcopy(version_scheme_argument),
+                        {
+                            "name": "--export-template",
+                            "default": None,
+                            "help": "Export the changelog template into this file instead of rendering it",
+                        },
+                        *deepcopy(tpl_arguments),
+                    ],
+                },
+                {
+                    "name": ["check"],
+                    "help": "validates that a commit message matches the commitizen schema",
+                    "func": "Check",
+                    "arguments": [
+                        {
+                            "name": "--commit-msg-file",
+                            "help": (
+                                "ask for the name of the temporal file that contains "
+                                "the commit message. "
+                                "Using it in a git hook script: MSG_FILE=$1"
+                            ),
+                            "exclusive_group": "group1",
+                        },
+                        {
+                            "name": "--rev-range",
+                            "help": "a range of git rev to check. e.g, master..HEAD",
+                            "exclusive_group": "group1",
+                        },
+                        {
+                            "name": ["-m", "--message"],
+                            "help": "commit message that needs to be checked",
+                            "exclusive_group": "group1",
+                        },
+                        {
+                            "name": ["--allow-abort"],
+                            "action": "store_true",
+                            "default": False,
+                            "help": "allow empty commit messages, which typically abort a commit",
+                        },
+                        {
+                            "name": ["--allowed-prefixes"],
+                            "nargs": "*",
+                            "help": "allowed commit message prefixes. "
+                            "If the message starts by one of these prefixes, "
+                            "the message won't be checked against the regex",
+                        },
+                    ],
+                },
+                {
+                    "name": ["version"],
+                    "help": (
+                        "get the version of the installed commitizen or the current project"
+                        " (default: installed commitizen)"
+                    ),
+                    "func": "Version",
+                    "arguments": [
+                        {
+                            "name": ["-r", "--report"],
+                            "help": "get system information for reporting bugs",
+                            "action": "store_true",
+                            "exclusive_group": "group1",
+                        },
+                        {
+                            "name": ["-p", "--project"],
+                            "help": "get the version of the current project",
+                            "action": "store_true",
+                            "exclusive_group": "group1",
+                        },
+                        {
+                            "name": ["-c", "--commitizen"],
+                            "help": "get the version of the installed commitizen",
+                            "action": "store_true",
+                            "exclusive_group": "group1",
+                        },
+                        {
+                            "name": ["-v", "--verbose"],
+                            "help": (
+                                "get the version of both the installed commitizen "
+                                "and the current project"
+                            ),
+                            "action": "store_true",
+                            "exclusive_group": "group1",
+                        },
+                    ],
+                },
+            ],
+        },
+    }
+
+
+_data: dict | None = None
+
+
+def _get_data() -> dict:
+    global _data
+    if _data is None:
+        _data = _build_data()
+    return _data
+
+
+def __getattr__(name: str):
+    # Keep `commitizen.cli.data` importable without paying for the spec
+    # (and the version-scheme discovery behind it) at module import.
+    if name == "data":
+        return _get_data()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-original_excepthook = sys.excepthook
+
+def _identity(value):
+    """Picklable stand-in for the local identity closure of argparse.
+
+    `ArgumentParser` registers a closure as its default type handler,
+    which would make the parser unpicklable.
+    """
+    return value
+
+
+def _make_picklable(parser: argparse.ArgumentParser) -> None:
+    parser._registries["type"][None] = _identity
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            for subparser in action.choices.values():
+                _make_picklable(subparser)
+
+
+# Root-parser options that consume a following value; the argv sniffer
+# needs them to tell an option value apart from the subcommand.
+_root_value_options = frozenset(("-n", "--name", "-nr", "--no-raise"))
+
+
+def _sniff_subcommand(argv: Sequence[str]) -> str | None:
+    """Return the invoked subcommand when it can be determined safely.
+
+    Knowing the subcommand up front lets the parser be built for that
+    command alone instead of all of them. Whenever the answer is not
+    obvious (no positional token, an unknown name, or an explicit help
+    request that must list every command) fall back to the full parser
+    by returning None.
+    """
+    known_names = {
+        name
+        for command in _get_data()["subcommands"]["commands"]
+        for name in (
+            command["name"] if isinstance(command["name"], list) else [command["name"]]
+        )
+    }
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if token in ("-h", "--help"):
+            return None
+        if token.startswith("-"):
+            skip_next = token in _root_value_options
+            continue
+        return token if token in known_names else None
+    return None
+
+
+def _command_data(command: str) -> dict:
+    """Build a copy of the parser spec holding only the given subcommand."""
+    subcommands = _get_data()["subcommands"]
+    commands = [
+        c
+        for c in subcommands["commands"]
+        if command == c["name"]
+        or (isinstance(c["name"], list) and command in c["name"])
+    ]
+    data = _get_data()
+    return {**data, "subcommands": {**subcommands, "commands": commands}}
+
+
+def _parser_cache_file(command: str | None = None) -> Path:
+    from commitizen.__version__ import __version__
+
+    # Key the cache on everything that shapes the parser: the commitizen
+    # and python versions plus a digest of the spec itself, so editing
+    # `data` (e.g. in a development checkout) never serves a stale parser.
+    from hashlib import md5
+
+    spec_digest = md5(repr(_get_data()).encode()).hexdigest()[:8]
+    # An empty XDG_CACHE_HOME counts as unset per the XDG spec.
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(cache_home) / "commitizen"
+    pyver = "{}.{}".format(*sys.version_info[:2])
+    suffix = f"-{command}" if command else ""
+    return cache_dir / f"parser-{__version__}-py{pyver}-{spec_digest}{suffix}.pkl"
+
+
+def _get_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Return the argument parser, unpickling a cached one when possible.
+
+    Building the full parser from the spec dominates the start-up time of
+    every invocation, so the built parser is cached on disk and, when the
+    invoked subcommand is known, only that command's parser is built and
+    cached. Any problem with the cache (corrupt file, unwritable
+    directory) silently falls back to a fresh build.
+    """
+    import pickle
+
+    cache_file = _parser_cache_file(command)
+    try:
+        with open(cache_file, "rb") as f:
+            return cast(argparse.ArgumentParser, pickle.load(f))
+    except Exception:
+        pass
+
+    from decli import cli
+
+    parser = cli(_command_data(command) if command else _get_data())
+    _make_picklable(parser)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(parser, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_file.replace(cache_file)
+    except (OSError, pickle.PicklingError):
+        pass
+    return parser
+
+
+original_excepthook = sys.__excepthook__
 
 
 def commitizen_excepthook(
@@ -479,8 +625,6 @@ def commitizen_excepthook(
 
 commitizen_debug_excepthook = partial(commitizen_excepthook, debug=True)
 
-sys.excepthook = commitizen_excepthook
-
 
 def parse_no_raise(comma_separated_no_raise: str) -> list[int]:
     """Convert the given string to exit codes.
@@ -505,10 +649,22 @@ def parse_no_raise(comma_separated_no_raise: str) -> list[int]:
 
 
 def main():
-    conf = config.read_cfg()
-    parser = cli(data)
+    # Take over exception reporting only when running as a CLI, so that a
+    # plain `import commitizen.cli` does not mutate global state.
+    sys.excepthook = commitizen_excepthook
+
+    # Import the heavy subsystems only when a command is actually going to
+    # run, so that `import commitizen.cli` stays cheap.
+    from commitizen import commands, config
 
-    argcomplete.autocomplete(parser)
+    parser = _get_parser(_sniff_subcommand(sys.argv[1:]))
+
+    # `argcomplete.autocomplete` only acts when the shell completion
+    # machinery exported _ARGCOMPLETE; otherwise skip even its import.
+    if "_ARGCOMPLETE" in os.environ:
+        import argcomplete
+
+        argcomplete.autocomplete(parser)
     # Show help if no arg provided
     if len(sys.argv) == 1:
         parser.print_help(sys.stderr)
@@ -547,6 +703,8 @@ def main():
         extra_args = " ".join(unknown_args[1:])
         arguments["extra_cli_args"] = extra_args
 
+    conf = config.BaseConfig() if args.no_config else config.read_cfg()
+
     if args.name:
         conf.update({"name": args.name})
     elif not args.name and not conf.path:
@@ -562,7 +720,9 @@ def main():
         )
         sys.excepthook = no_raise_debug_excepthook
 
-    args.func(conf, arguments)()
+    # `func` is stored as the command class name so that building the
+    # parser does not force an import of every command implementation.
+    getattr(commands, args.func)(conf, arguments)()
 
 
 if __name__ == "__main__":
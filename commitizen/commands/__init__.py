@@ -1,13 +1,34 @@
-from .bump import Bump
-from .changelog import Changelog
-from .check import Check
-from .commit import Commit
-from .example import Example
-from .info import Info
-from .init import Init
-from .list_cz import ListCz
-from .schema import Schema
-from .version import Version
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bump import Bump
+    from .changelog import Changelog
+    from .check import Check
+    from .commit import Commit
+    from .example import Example
+    from .info import Info
+    from .init import Init
+    from .list_cz import ListCz
+    from .schema import Schema
+    from .version import Version
+
+# Map each command class to its module so that a command is imported only
+# when it is actually dispatched, instead of on `import commitizen.commands`.
+_commands = {
+    "Bump": ".bump",
+    "Changelog": ".changelog",
+    "Check": ".check",
+    "Commit": ".commit",
+    "Example": ".example",
+    "Info": ".info",
+    "Init": ".init",
+    "ListCz": ".list_cz",
+    "Schema": ".schema",
+    "Version": ".version",
+}
 
 __all__ = (
     "Bump",
@@ -21,3 +42,13 @@ __all__ = (
     "Version",
     "Init",
 )
+
+
+def __getattr__(name: str):
+    try:
+        module = _commands[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    command = getattr(import_module(module, __name__), name)
+    globals()[name] = command
+    return command
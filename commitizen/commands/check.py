@@ -17,14 +17,18 @@ from commitizen.exceptions import (
 class Check:
     """Check if the current commit msg matches the commitizen format."""
 
-    def __init__(self, config: BaseConfig, arguments: dict[str, Any], cwd=os.getcwd()):
+    def __init__(
+        self, config: BaseConfig, arguments: dict[str, Any], cwd: str | None = None
+    ):
         """Initial check command.
 
         Args:
             config: The config object required for the command to perform its action
             arguments: All the flags provided by the user
-            cwd: Current work directory
+            cwd: Current work directory, defaults to the process one at call time
         """
+        if cwd is None:
+            cwd = os.getcwd()
         self.commit_msg_file: str | None = arguments.get("commit_msg_file")
         self.commit_msg: str | None = arguments.get("message")
         self.rev_range: str | None = arguments.get("rev_range")
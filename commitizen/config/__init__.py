@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Iterable, Iterator, Type, Union
 
 from commitizen import defaults, git
 
@@ -9,40 +11,114 @@ from .json_config import JsonConfig
 from .toml_config import TomlConfig
 from .yaml_config import YAMLConfig
 
+# Remember where the config was found for each working directory, so that
+# repeated `read_cfg()` calls in one process (tests, hook scripts) skip the
+# git lookup and the directory walk. Only the *path* is cached: commands
+# like `bump` rewrite the file through `set_key`, so the content has to be
+# re-read every time.
+_conf_path_cache: dict[str, Path] = {}
 
-def read_cfg() -> BaseConfig:
-    conf = BaseConfig()
+_ConfLoader = Union[Type[TomlConfig], Type[JsonConfig], Type[YAMLConfig]]
+
+_loaders: dict[str, _ConfLoader] = {
+    ".toml": TomlConfig,
+    ".json": JsonConfig,
+    ".yaml": YAMLConfig,
+    ".yml": YAMLConfig,
+}
+
+# `defaults.config_files` is static, so the name -> loader pairing is
+# resolved once at import time instead of per candidate file.
+_config_file_loaders: tuple[tuple[str, _ConfLoader], ...] = tuple(
+    (fname, _loaders[Path(fname).suffix]) for fname in defaults.config_files
+)
 
-    git_project_root = git.find_git_project_root()
-    cfg_search_paths = [Path(".")]
-    if git_project_root:
-        cfg_search_paths.append(git_project_root)
-
-    cfg_paths = (
-        path / Path(filename)
-        for path in cfg_search_paths
-        for filename in defaults.config_files
-    )
-    for filename in cfg_paths:
-        if not filename.exists():
-            continue
 
-        _conf: TomlConfig | JsonConfig | YAMLConfig
+def _load_conf_file(
+    filename: Path, loader: _ConfLoader | None = None
+) -> TomlConfig | JsonConfig | YAMLConfig | None:
+    if loader is None:
+        loader = _loaders.get(filename.suffix)
+        if loader is None:
+            return None
 
+    # Open directly instead of probing with `exists()` first: the open
+    # already reports a missing candidate, at half the syscalls.
+    try:
         with open(filename, "rb") as f:
             data: bytes = f.read()
+    except OSError:
+        return None
+
+    # A blank placeholder file can never hold a commitizen section;
+    # skip it without spinning up a parser.
+    if not data.strip():
+        return None
+
+    _conf = loader(data=data, path=filename)
+    if _conf.is_empty_config:
+        return None
+    return _conf
+
+
+def read_cfg() -> BaseConfig:
+    # Explicit opt-out (CI passing everything through flags): skip the
+    # search and the file parse entirely.
+    if os.environ.get("CZ_NO_CONFIG"):
+        return BaseConfig()
 
-        if "toml" in filename.suffix:
-            _conf = TomlConfig(data=data, path=filename)
-        elif "json" in filename.suffix:
-            _conf = JsonConfig(data=data, path=filename)
-        elif "yaml" in filename.suffix:
-            _conf = YAMLConfig(data=data, path=filename)
+    cwd = os.getcwd()
+    cached_path = _conf_path_cache.get(cwd)
+    if cached_path is not None:
+        _conf = _load_conf_file(cached_path)
+        if _conf is not None:
+            return _conf
+        # The cached file vanished or lost its commitizen section:
+        # fall back to a full search.
+        del _conf_path_cache[cwd]
 
-        if _conf.is_empty_config:
+    for filename, loader in _search_config_files(_search_dirs()):
+        _conf = _load_conf_file(filename, loader)
+        if _conf is None:
             continue
-        else:
-            conf = _conf
-            break
 
-    return conf
+        _conf_path_cache[cwd] = filename
+        return _conf
+
+    return BaseConfig()
+
+
+def _search_dirs() -> Iterator[Path]:
+    """Yield the directories to search for a config, in precedence order.
+
+    The working directory is probed first and git is only asked for the
+    project root when it holds no usable config: in the common case
+    (config next to the current directory) this avoids forking
+    `git rev-parse`. The git root is skipped when it is the working
+    directory itself, so the same files are never scanned twice.
+    """
+    cwd = Path.cwd()
+    yield cwd
+
+    git_project_root = git.find_git_project_root()
+    if git_project_root and git_project_root != cwd:
+        yield git_project_root
+
+
+def _search_config_files(paths: Iterable[Path]) -> Iterator[tuple[Path, _ConfLoader]]:
+    """Yield config file candidates, lazily per directory.
+
+    One directory listing replaces a syscall per candidate name, while
+    the `defaults.config_files` order keeps deciding precedence. A
+    non-file entry wearing a config name is weeded out downstream, where
+    _load_conf_file fails to open it.
+    """
+    for path in paths:
+        try:
+            with os.scandir(path) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            continue
+        for fname, loader in _config_file_loaders:
+            if fname in present:
+                yield path / fname, loader
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
 
 from tomlkit import exceptions, parse, table
@@ -8,6 +9,11 @@ from tomlkit import exceptions, parse, table
 from commitizen.exceptions import InvalidConfigurationError
 from .base_config import BaseConfig
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = None
+
 
 class TomlConfig(BaseConfig):
     def __init__(self, *, data: bytes | str, path: Path | str):
@@ -51,12 +57,23 @@ class TomlConfig(BaseConfig):
         name = "cz_conventional_commits"
         ```
         """
-        try:
-            doc = parse(data)
-        except exceptions.ParseError as e:
-            raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
+        if tomllib is not None:
+            # Reading does not need to preserve comments or formatting, so
+            # the C-accelerated stdlib parser beats tomlkit here; tomlkit
+            # stays in charge of the round-trip writes.
+            if isinstance(data, bytes):
+                data = data.decode("utf-8")
+            try:
+                doc = tomllib.loads(data)
+            except tomllib.TOMLDecodeError as e:
+                raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
+        else:
+            try:
+                doc = parse(data)
+            except exceptions.ParseError as e:
+                raise InvalidConfigurationError(f"Failed to parse {self.path}: {e}")
 
         try:
             self.settings.update(doc["tool"]["commitizen"])  # type: ignore
-        except exceptions.NonExistentKey:
+        except KeyError:  # also covers tomlkit's NonExistentKey
             self.is_empty_config = True
@@ -207,10 +207,26 @@ def get_tag_names() -> list[str | None]:
     return [tag.strip() for tag in c.out.split("\n") if tag.strip()]
 
 
+# Memoization for `find_git_project_root`, keyed by working directory.
+_git_project_roots: dict[str, Path] = {}
+
+
 def find_git_project_root() -> Path | None:
+    """Find the root of the current git project, forking git at most once.
+
+    A found root is remembered per working directory, since it cannot
+    change within one process. A miss is not cached: the directory may
+    become a repository later (e.g. through `git init` or `cz init`).
+    """
+    cwd = os.getcwd()
+    root = _git_project_roots.get(cwd)
+    if root is not None:
+        return root
     c = cmd.run("git rev-parse --show-toplevel")
     if not c.err:
-        return Path(c.out.strip())
+        root = Path(c.out.strip())
+        _git_project_roots[cwd] = root
+        return root
     return None
 
 
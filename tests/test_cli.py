@@ -53,6 +53,17 @@ def test_name_default_value(mocker: MockFixture, capsys):
     assert out.startswith("fix: correct minor typos in code")
 
 
+def test_no_config_flag(mocker: MockFixture, capsys, tmpdir):
+    with tmpdir.as_cwd():
+        tmpdir.join(".cz.toml").write('[tool.commitizen]\nname = "cz_jira"\n')
+        testargs = ["cz", "--no-config", "example"]
+        mocker.patch.object(sys, "argv", testargs)
+
+        cli.main()
+    out, _ = capsys.readouterr()
+    assert out.startswith("fix: correct minor typos in code")
+
+
 def test_ls(mocker: MockFixture, capsys):
     testargs = ["cz", "-n", "cz_jira", "ls"]
     mocker.patch.object(sys, "argv", testargs)
@@ -146,6 +146,15 @@ class TestReadCfg:
             cfg = config.read_cfg()
             assert cfg.settings == defaults.DEFAULT_SETTINGS
 
+    def test_conf_is_bypassed_by_env_var(_, tmpdir, monkeypatch):
+        with tmpdir.as_cwd():
+            p = tmpdir.join("pyproject.toml")
+            p.write(PYPROJECT)
+            monkeypatch.setenv("CZ_NO_CONFIG", "1")
+
+            cfg = config.read_cfg()
+            assert cfg.settings == defaults.DEFAULT_SETTINGS
+
     def test_load_empty_pyproject_toml_and_cz_toml_with_config(_, tmpdir):
         with tmpdir.as_cwd():
             p = tmpdir.join("pyproject.toml")